@@ -1139,6 +1139,14 @@ impl CircuitData {
         }
     }
 
+    /// Whether the circuit contains any control-flow operations.
+    ///
+    /// This stops at the first control-flow operation found, so is cheaper than checking the
+    /// result of :meth:`count_ops` for the control-flow names.
+    pub fn has_control_flow(&self) -> bool {
+        self.data.iter().any(|inst| inst.op.control_flow())
+    }
+
     pub fn num_nonlocal_gates(&self) -> usize {
         self.data
             .iter()
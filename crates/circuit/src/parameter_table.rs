@@ -136,6 +136,11 @@ pub struct ParameterTable {
     ///
     /// Any method that adds or removes a parameter needs to invalidate this.
     py_parameters_cache: OnceLock<Py<PyList>>,
+    /// Cache of a Python-space set of the parameter objects.  This is handed out directly to
+    /// Python space (which must not mutate it), so we generate it on demand.
+    ///
+    /// Any method that adds or removes a parameter needs to invalidate this.
+    py_parameters_unsorted_cache: OnceLock<Py<PySet>>,
 }
 
 impl ParameterTable {
@@ -250,9 +255,19 @@ impl ParameterTable {
             .clone()
     }
 
-    /// Get a Python set of all tracked `Parameter` objects.
+    /// Get the (maybe cached) Python set of all tracked `Parameter` objects.
+    ///
+    /// The returned set is shared with the cache, so callers must not mutate it.
     pub fn py_parameters_unsorted<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PySet>> {
-        PySet::new(py, self.by_uuid.values().map(|info| &info.object))
+        if let Some(set) = self.py_parameters_unsorted_cache.get() {
+            return Ok(set.bind(py).clone());
+        }
+        let set = PySet::new(py, self.by_uuid.values().map(|info| &info.object))?;
+        Ok(self
+            .py_parameters_unsorted_cache
+            .get_or_init(|| set.unbind())
+            .bind(py)
+            .clone())
     }
 
     /// Get the sorted order of the `ParameterTable`.  This does not access the cache.
@@ -353,6 +368,7 @@ impl ParameterTable {
         self.by_name.clear();
         self.vectors.clear();
         self.py_parameters_cache.take();
+        self.py_parameters_unsorted_cache.take();
         ParameterTableDrain {
             order: order.into_iter(),
             by_uuid,
@@ -371,6 +387,7 @@ impl ParameterTable {
     fn invalidate_cache(&mut self) {
         self.order_cache.take();
         self.py_parameters_cache.take();
+        self.py_parameters_unsorted_cache.take();
     }
 
     /// Expose the tracked data for a given parameter as directly as possible to Python space.
@@ -408,6 +425,9 @@ impl ParameterTable {
         if let Some(list) = self.py_parameters_cache.get() {
             visit.call(list)?
         }
+        if let Some(set) = self.py_parameters_unsorted_cache.get() {
+            visit.call(set)?
+        }
         Ok(())
     }
 }
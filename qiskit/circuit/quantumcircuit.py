@@ -4350,8 +4350,8 @@ class QuantumCircuit:
             should not be mutated.  This is an internal performance detail.  Code outside of this
             package should not use this method.
         """
-        # This should be free, by accessing the actual backing data structure of the table, but that
-        # means that we need to copy it if adding keys from the global phase.
+        # This is free after the first call; the set is cached by the parameter table until the
+        # tracked parameters change.
         return self._data.unsorted_parameters()
 
     @overload
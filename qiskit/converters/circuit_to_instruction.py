@@ -11,7 +11,6 @@
 # that they have been altered from the originals.
 
 """Helper function for converting a circuit to an instruction."""
-from qiskit.circuit.controlflow import CONTROL_FLOW_OP_NAMES
 from qiskit.exceptions import QiskitError
 from qiskit.circuit.instruction import Instruction
 from qiskit.circuit import QuantumRegister
@@ -63,6 +62,11 @@ def circuit_to_instruction(circuit, parameter_map=None, equivalence_library=None
     # pylint: disable=cyclic-import
     from qiskit.circuit.quantumcircuit import QuantumCircuit
 
+    # Blueprint circuits only build themselves when one of their public accessors is used, but the
+    # conversion reads the circuit's internal data directly.
+    if not getattr(circuit, "_is_built", True):
+        circuit._build()
+
     if circuit.num_input_vars:
         # This could be supported by moving the `input` variables to be parameters of the
         # instruction, but we don't really have a good representation of that yet, so safer to
@@ -84,7 +88,7 @@ def circuit_to_instruction(circuit, parameter_map=None, equivalence_library=None
             "Circuits with internal variables cannot yet be converted to instructions."
             " You may be able to use `QuantumCircuit.compose` to inline this circuit into another."
         )
-    if CONTROL_FLOW_OP_NAMES.intersection(circuit.count_ops()):
+    if circuit._data.has_control_flow():
         raise QiskitError(
             "Circuits with control flow operations cannot be converted to an instruction."
         )
@@ -93,12 +97,15 @@ def circuit_to_instruction(circuit, parameter_map=None, equivalence_library=None
         parameter_dict = {p: p for p in circuit.parameters}
     else:
         parameter_dict = circuit._unroll_param_dict(parameter_map)
-
-    if parameter_dict.keys() != circuit.parameters:
-        raise QiskitError(
-            "parameter_map should map all circuit parameters. "
-            f"Circuit parameters: {circuit.parameters}, parameter_map: {parameter_dict}"
-        )
+        # Fetch the (unsorted) parameters once; this is all that's needed for the validation.
+        parameters = circuit._unsorted_parameters()
+        extra = parameter_dict.keys() - parameters
+        missing = parameters - parameter_dict.keys()
+        if extra or missing:
+            raise QiskitError(
+                "parameter_map should map all circuit parameters. "
+                f"Circuit parameters: {circuit.parameters}, parameter_map: {parameter_dict}"
+            )
 
     out_instruction = Instruction(
         name=circuit.name,
@@ -109,33 +116,45 @@ def circuit_to_instruction(circuit, parameter_map=None, equivalence_library=None
     )
     out_instruction._condition = None
 
-    target = circuit.assign_parameters(parameter_dict, inplace=False)
-
-    if equivalence_library is not None:
-        equivalence_library.add_equivalence(out_instruction, target)
-
-    regs = []
-    qreg, creg = None, None
+    qregs, cregs = [], []
     if out_instruction.num_qubits > 0:
-        qreg = QuantumRegister(out_instruction.num_qubits, "q")
-        regs.append(qreg)
+        qregs.append(QuantumRegister(out_instruction.num_qubits, "q"))
 
     if out_instruction.num_clbits > 0:
-        creg = ClassicalRegister(out_instruction.num_clbits, "c")
-        regs.append(creg)
-
-    data = target._data.copy()
-    data.replace_bits(qubits=qreg, clbits=creg)
+        cregs.append(ClassicalRegister(out_instruction.num_clbits, "c"))
+
+    # Build the definition first and assign the parameters in place on it afterwards; this means we
+    # only ever copy the input circuit's data once, and never touch the input circuit itself.  The
+    # copy is a bulk clone of the packed instructions and interned bit lists in Rust, and carries
+    # the global phase (and its parameter tracking) along with it.
+    data = circuit._data.copy()
+    # Flatten onto the new registers in one go.  Instructions refer to bits by their index, so only
+    # the bit objects and register information are swapped out; no instruction is rewritten.
+    data.replace_bits(
+        qubits=[bit for reg in qregs for bit in reg],
+        clbits=[bit for reg in cregs for bit in reg],
+        qregs=qregs,
+        cregs=cregs,
+    )
 
-    qc = QuantumCircuit(name=out_instruction.name)
-    qc._data = data
+    qc = QuantumCircuit._from_circuit_data(data, name=out_instruction.name)
 
-    # Re-add the registers.
-    for reg in regs:
-        qc.add_register(reg)
+    if parameter_map is not None and parameter_dict:
+        # The mapping is already unrolled and validated against the circuit's parameters, so we can
+        # bind it all in one pass directly on the data.  With no map, the parameters map to
+        # themselves and there is nothing to do.
+        qc._data.assign_parameters_mapping(parameter_dict)
 
-    if circuit.global_phase:
-        qc.global_phase = circuit.global_phase
+    if equivalence_library is not None:
+        # The library expects the circuit in terms of the input's bits.  It only clones the
+        # circuit's data, which still shares the operation objects, so it must be given a copy
+        # rather than the caller's own circuit.
+        if parameter_map is not None and parameter_dict:
+            equivalence_library.add_equivalence(
+                out_instruction, circuit.assign_parameters(parameter_dict, flat_input=True)
+            )
+        else:
+            equivalence_library.add_equivalence(out_instruction, circuit.copy())
 
     out_instruction.definition = qc
 
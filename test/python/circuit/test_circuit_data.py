@@ -227,6 +227,23 @@ class TestQuantumCircuitData(QiskitTestCase):
         data.map_nonstandard_ops(lambda op: op.to_mutable())
         self.assertTrue(all(inst.operation.mutable for inst in data))
 
+    def test_has_control_flow(self):
+        """Test that control-flow operations are detected, at any position."""
+        qc = QuantumCircuit(2, 1)
+        qc.h(0)
+        qc.cx(0, 1)
+        self.assertFalse(qc._data.has_control_flow())
+        with qc.box():
+            qc.x(0)
+        self.assertTrue(qc._data.has_control_flow())
+
+        qc = QuantumCircuit(2, 1)
+        with qc.if_test((qc.clbits[0], 0)):
+            qc.x(0)
+        qc.h(0)
+        self.assertTrue(qc._data.has_control_flow())
+        self.assertFalse(CircuitData().has_control_flow())
+
     def test_replace_bits(self):
         """Test replacing qubits and clbits with sequence reversed."""
         qr = QuantumRegister(3)
@@ -537,6 +537,44 @@ class TestSessionEquivalenceLibrary(QiskitTestCase):
         self.assertEqual(gate_entry[0], qc_gate)
         self.assertEqual(inst_entry[0], qc_inst)
 
+    def test_converter_instruction_registration_parameter_map(self):
+        """Verify the instruction converter registers the mapped circuit in an equivalence
+        library, without modifying the input circuit."""
+        theta = Parameter("theta")
+        gamma = Parameter("gamma")
+        qc = QuantumCircuit([Qubit() for _ in range(2)])
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+
+        eq_lib = EquivalenceLibrary()
+        inst = circuit_to_instruction(qc, {theta: gamma}, equivalence_library=eq_lib)
+
+        expected = QuantumCircuit(qc.qubits)
+        expected.rx(gamma, 0)
+        expected.cx(0, 1)
+
+        entry = eq_lib.get_entry(inst)
+        self.assertEqual(len(entry), 1)
+        self.assertEqual(entry[0], expected)
+        self.assertEqual(qc.parameters, {theta})
+
+    def test_converter_instruction_registration_is_independent(self):
+        """Verify that mutating a custom operation of the input circuit after converting it does not
+        affect the circuit registered in the equivalence library."""
+        custom = Gate("custom", 1, [])
+        qc = QuantumCircuit([Qubit() for _ in range(2)])
+        qc.append(custom, [0])
+        qc.cx(0, 1)
+
+        eq_lib = EquivalenceLibrary()
+        inst = circuit_to_instruction(qc, equivalence_library=eq_lib)
+
+        qc.data[0].operation.label = "mutated"
+
+        entry = eq_lib.get_entry(inst)
+        self.assertEqual(len(entry), 1)
+        self.assertIsNone(entry[0].data[0].operation.label)
+
     def test_gate_decomposition_properties(self):
         """Verify decompositions are accessible via gate properties."""
         qc = QuantumCircuit([Qubit() for _ in range(2)])
@@ -195,6 +195,22 @@ class TestParameters(QiskitTestCase):
         ((instruction_index, _),) = list(qc._data._raw_parameter_table_entry(theta))
         self.assertEqual(rxg, qc.data[instruction_index].operation)
 
+    def test_unsorted_parameters_tracks_changes(self):
+        """Test that the unsorted parameters stay in sync with the circuit as parameters are added
+        and removed."""
+        a, b = Parameter("a"), Parameter("b")
+        qc = QuantumCircuit(1)
+        self.assertEqual(qc._unsorted_parameters(), set())
+        qc.rx(a, 0)
+        self.assertEqual(qc._unsorted_parameters(), {a})
+        qc.rz(b, 0)
+        self.assertEqual(qc._unsorted_parameters(), {a, b})
+        qc.assign_parameters({a: 1.0}, inplace=True)
+        self.assertEqual(qc._unsorted_parameters(), {b})
+        qc.global_phase = a
+        self.assertEqual(qc._unsorted_parameters(), {a, b})
+        self.assertEqual(qc.copy()._unsorted_parameters(), {a, b})
+
     def test_parameters_property_by_index(self):
         """Test getting parameters by index"""
         x = Parameter("x")
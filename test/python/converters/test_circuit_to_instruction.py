@@ -13,134 +13,169 @@
 """Tests for the converters."""
 
 import math
+import re
 import unittest
 
+import ddt
 import numpy as np
 
 from qiskit.converters import circuit_to_instruction
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.circuit import Qubit, Clbit
-from qiskit.circuit import Parameter
+from qiskit.circuit import Gate, Parameter, ParameterVector
 from qiskit.circuit.classical import expr, types
+from qiskit.circuit.library import TwoLocal
 from qiskit.quantum_info import Operator
 from qiskit.exceptions import QiskitError
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
-
+THETA = Parameter("theta")
+PHI = Parameter("phi")
+GAMMA = Parameter("gamma")
+DELTA = Parameter("delta")
+
+_CAPTURES_RE = re.compile(r"Circuits that capture variables cannot")
+_INPUTS_RE = re.compile(r"Circuits with 'input' variables cannot")
+_DECLARED_RE = re.compile(
+    r"Circuits with internal variables.*You may be able to use `QuantumCircuit.compose`"
+)
+
+
+def _flatten_registers():
+    """Circuit whose bits are all in registers."""
+    qr1 = QuantumRegister(4, "qr1")
+    qr2 = QuantumRegister(3, "qr2")
+    qr3 = QuantumRegister(3, "qr3")
+    cr1 = ClassicalRegister(4, "cr1")
+    cr2 = ClassicalRegister(1, "cr2")
+    circ = QuantumCircuit(qr1, qr2, qr3, cr1, cr2)
+    circ.cx(qr1[1], qr2[2])
+    circ.measure(qr3[0], cr2[0])
+    return circ
+
+
+def _flatten_registerless():
+    """Circuit with bits that are not contained in any register."""
+    qr1 = QuantumRegister(2)
+    qubits = [Qubit(), Qubit(), Qubit()]
+    qr2 = QuantumRegister(3)
+    cr1 = ClassicalRegister(2)
+    clbits = [Clbit(), Clbit(), Clbit()]
+    cr2 = ClassicalRegister(3)
+    circ = QuantumCircuit(qr1, qubits, qr2, cr1, clbits, cr2)
+    circ.cx(3, 5)
+    circ.measure(4, 4)
+    return circ
+
+
+def _flatten_overlapping_registers():
+    """Circuit with bits that are contained in more than one register."""
+    qubits = [Qubit() for _ in range(10)]
+    qr1 = QuantumRegister(bits=qubits[:6])
+    qr2 = QuantumRegister(bits=qubits[4:])
+    clbits = [Clbit() for _ in range(10)]
+    cr1 = ClassicalRegister(bits=clbits[:6])
+    cr2 = ClassicalRegister(bits=clbits[4:])
+    circ = QuantumCircuit(qubits, clbits, qr1, qr2, cr1, cr2)
+    circ.cx(3, 5)
+    circ.measure(4, 4)
+    return circ
+
+
+@ddt.ddt
 class TestCircuitToInstruction(QiskitTestCase):
     """Test Circuit to Instruction."""
 
-    def test_flatten_circuit_registers(self):
-        """Check correct flattening"""
-        qr1 = QuantumRegister(4, "qr1")
-        qr2 = QuantumRegister(3, "qr2")
-        qr3 = QuantumRegister(3, "qr3")
-        cr1 = ClassicalRegister(4, "cr1")
-        cr2 = ClassicalRegister(1, "cr2")
-        circ = QuantumCircuit(qr1, qr2, qr3, cr1, cr2)
-        circ.cx(qr1[1], qr2[2])
-        circ.measure(qr3[0], cr2[0])
-
-        inst = circuit_to_instruction(circ)
-        q = QuantumRegister(10, "q")
-        c = ClassicalRegister(5, "c")
-
-        self.assertEqual(inst.definition[0].qubits, (q[1], q[6]))
-        self.assertEqual(inst.definition[1].qubits, (q[7],))
-        self.assertEqual(inst.definition[1].clbits, (c[4],))
-
-    def test_flatten_circuit_registerless(self):
-        """Test that the conversion works when the given circuit has bits that are not contained in
-        any register."""
-        qr1 = QuantumRegister(2)
-        qubits = [Qubit(), Qubit(), Qubit()]
-        qr2 = QuantumRegister(3)
-        cr1 = ClassicalRegister(2)
-        clbits = [Clbit(), Clbit(), Clbit()]
-        cr2 = ClassicalRegister(3)
-        circ = QuantumCircuit(qr1, qubits, qr2, cr1, clbits, cr2)
-        circ.cx(3, 5)
-        circ.measure(4, 4)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The parametric tests all convert the same circuit.  The conversion never modifies its
+        # input, so it's safe to share between them.
+        cls.qr = QuantumRegister(3, "qr")
+        cls.param_circuit = QuantumCircuit(cls.qr)
+        cls.param_circuit.rz(THETA, cls.qr[0])
+        cls.param_circuit.rz(PHI, cls.qr[1])
+        cls.param_circuit.u(THETA, PHI, 0, cls.qr[2])
+        cls.param_circuit.rz(THETA + PHI, cls.qr[0])
+
+        # Circuits with each kind of forbidden variable.  The conversion rejects these before doing
+        # anything with them, so they're shared too.
+        cls.captured_vars_circuit = QuantumCircuit(captures=[expr.Var.new("a", types.Bool())])
+        cls.input_vars_circuit = QuantumCircuit(inputs=[expr.Var.new("a", types.Bool())])
+        cls.declared_vars_circuit = QuantumCircuit()
+        cls.declared_vars_circuit.add_var("a", False)
+
+    @ddt.data(
+        (_flatten_registers, (1, 6), (7,), (4,)),
+        (_flatten_registerless, (3, 5), (4,), (4,)),
+        (_flatten_overlapping_registers, (3, 5), (4,), (4,)),
+    )
+    @ddt.unpack
+    def test_flatten_circuit(self, builder, cx_qubits, measure_qubits, measure_clbits):
+        """Test that the conversion flattens the bits onto single registers, whether the given
+        circuit's bits are in registers, not in any register, or in more than one register."""
+        circ = builder()
 
         inst = circuit_to_instruction(circ)
-        self.assertEqual(inst.num_qubits, len(qr1) + len(qubits) + len(qr2))
-        self.assertEqual(inst.num_clbits, len(cr1) + len(clbits) + len(cr2))
+        self.assertEqual(inst.num_qubits, circ.num_qubits)
+        self.assertEqual(inst.num_clbits, circ.num_clbits)
+        q = QuantumRegister(circ.num_qubits, "q")
+        c = ClassicalRegister(circ.num_clbits, "c")
         inst_definition = inst.definition
+        self.assertEqual(inst_definition.qregs, [q])
+        self.assertEqual(inst_definition.cregs, [c])
         cx = inst_definition.data[0]
         measure = inst_definition.data[1]
-        self.assertEqual(cx.qubits, (inst_definition.qubits[3], inst_definition.qubits[5]))
+        self.assertEqual(cx.qubits, tuple(q[i] for i in cx_qubits))
         self.assertEqual(cx.clbits, ())
-        self.assertEqual(measure.qubits, (inst_definition.qubits[4],))
-        self.assertEqual(measure.clbits, (inst_definition.clbits[4],))
-
-    def test_flatten_circuit_overlapping_registers(self):
-        """Test that the conversion works when the given circuit has bits that are contained in more
-        than one register."""
-        qubits = [Qubit() for _ in [None] * 10]
-        qr1 = QuantumRegister(bits=qubits[:6])
-        qr2 = QuantumRegister(bits=qubits[4:])
-        clbits = [Clbit() for _ in [None] * 10]
-        cr1 = ClassicalRegister(bits=clbits[:6])
-        cr2 = ClassicalRegister(bits=clbits[4:])
-        circ = QuantumCircuit(qubits, clbits, qr1, qr2, cr1, cr2)
-        circ.cx(3, 5)
-        circ.measure(4, 4)
+        self.assertEqual(measure.qubits, tuple(q[i] for i in measure_qubits))
+        self.assertEqual(measure.clbits, tuple(c[i] for i in measure_clbits))
+
+    def test_definition_does_not_alias_input(self):
+        """Test that the definition is independent of the input circuit, even when there are no
+        parameters to assign."""
+        # A custom gate (rather than a standard one) is stored as a Python object, so this checks
+        # that the operations are copied and not shared.
+        custom = Gate("custom", 1, [])
+        qc = QuantumCircuit(2, 1, global_phase=0.5)
+        qc.append(custom, [0])
+        qc.cx(0, 1)
+        qc.measure(1, 0)
+        expected = qc.copy()
 
-        inst = circuit_to_instruction(circ)
-        self.assertEqual(inst.num_qubits, len(qubits))
-        self.assertEqual(inst.num_clbits, len(clbits))
-        inst_definition = inst.definition
-        cx = inst_definition.data[0]
-        measure = inst_definition.data[1]
-        self.assertEqual(cx.qubits, (inst_definition.qubits[3], inst_definition.qubits[5]))
-        self.assertEqual(cx.clbits, ())
-        self.assertEqual(measure.qubits, (inst_definition.qubits[4],))
-        self.assertEqual(measure.clbits, (inst_definition.clbits[4],))
+        inst = circuit_to_instruction(qc)
+        self.assertIsNot(inst.definition.data[0].operation, qc.data[0].operation)
+        inst.definition.x(0)
+        inst.definition.data[0].operation.label = "mutated"
+        self.assertIsNone(qc.data[0].operation.label)
+        self.assertEqual(qc, expected)
+
+        qc.data[0].operation.label = "changed"
+        qc.z(1)
+        self.assertEqual(inst.definition.data[0].operation.label, "mutated")
+        self.assertEqual(len(inst.definition.data), 4)
 
     def test_flatten_parameters(self):
         """Verify parameters from circuit are moved to instruction.params"""
-        qr = QuantumRegister(3, "qr")
-        qc = QuantumCircuit(qr)
-
-        theta = Parameter("theta")
-        phi = Parameter("phi")
-        sum_ = theta + phi
+        inst = circuit_to_instruction(self.param_circuit)
 
-        qc.rz(theta, qr[0])
-        qc.rz(phi, qr[1])
-        qc.u(theta, phi, 0, qr[2])
-        qc.rz(sum_, qr[0])
-
-        inst = circuit_to_instruction(qc)
-
-        self.assertEqual(inst.params, [phi, theta])
-        self.assertEqual(inst.definition[0].operation.params, [theta])
-        self.assertEqual(inst.definition[1].operation.params, [phi])
-        self.assertEqual(inst.definition[2].operation.params, [theta, phi, 0])
-        self.assertEqual(str(inst.definition[3].operation.params[0]), "phi + theta")
+        self.assertEqual(inst.params, [PHI, THETA])
+        self.assertEqual(inst.definition[0].operation.params, [THETA])
+        self.assertEqual(inst.definition[1].operation.params, [PHI])
+        self.assertEqual(inst.definition[2].operation.params, [THETA, PHI, 0])
+        sum_ = inst.definition[3].operation.params[0]
+        self.assertEqual(sum_.parameters, {THETA, PHI})
+        self.assertEqual(sum_.bind({THETA: 1, PHI: 2}).numeric(), 3)
 
     def test_underspecified_parameter_map_raises(self):
         """Verify we raise if not all circuit parameters are present in parameter_map."""
-        qr = QuantumRegister(3, "qr")
-        qc = QuantumCircuit(qr)
-
-        theta = Parameter("theta")
-        phi = Parameter("phi")
-        sum_ = theta + phi
-
-        gamma = Parameter("gamma")
-
-        qc.rz(theta, qr[0])
-        qc.rz(phi, qr[1])
-        qc.u(theta, phi, 0, qr[2])
-        qc.rz(sum_, qr[0])
+        qc = self.param_circuit
 
-        self.assertRaises(QiskitError, circuit_to_instruction, qc, {theta: gamma})
+        self.assertRaises(QiskitError, circuit_to_instruction, qc, {THETA: GAMMA})
 
         # Raise if provided more parameters than present in the circuit
-        delta = Parameter("delta")
         self.assertRaises(
-            QiskitError, circuit_to_instruction, qc, {theta: gamma, phi: phi, delta: delta}
+            QiskitError, circuit_to_instruction, qc, {THETA: GAMMA, PHI: PHI, DELTA: DELTA}
         )
 
     def test_control_flow_raises(self):
@@ -150,33 +185,49 @@ class TestCircuitToInstruction(QiskitTestCase):
         qc.h(0)
         qc.cx(0, 1)
         qc.measure_all()
-        with qc.if_test((qc.clbits[0], 0)):
+        cbit0 = qc.clbits[0]
+        with qc.if_test((cbit0, 0)):
             qc.x(0)
         self.assertRaises(QiskitError, circuit_to_instruction, qc)
 
     def test_parameter_map(self):
         """Verify alternate parameter specification"""
-        qr = QuantumRegister(3, "qr")
-        qc = QuantumCircuit(qr)
-
-        theta = Parameter("theta")
-        phi = Parameter("phi")
-        sum_ = theta + phi
-
-        gamma = Parameter("gamma")
-
-        qc.rz(theta, qr[0])
-        qc.rz(phi, qr[1])
-        qc.u(theta, phi, 0, qr[2])
-        qc.rz(sum_, qr[0])
-
-        inst = circuit_to_instruction(qc, {theta: gamma, phi: phi})
-
-        self.assertEqual(inst.params, [gamma, phi])
-        self.assertEqual(inst.definition[0].operation.params, [gamma])
-        self.assertEqual(inst.definition[1].operation.params, [phi])
-        self.assertEqual(inst.definition[2].operation.params, [gamma, phi, 0])
-        self.assertEqual(str(inst.definition[3].operation.params[0]), "gamma + phi")
+        inst = circuit_to_instruction(self.param_circuit, {THETA: GAMMA, PHI: PHI})
+
+        self.assertEqual(inst.params, [GAMMA, PHI])
+        self.assertEqual(inst.definition[0].operation.params, [GAMMA])
+        self.assertEqual(inst.definition[1].operation.params, [PHI])
+        self.assertEqual(inst.definition[2].operation.params, [GAMMA, PHI, 0])
+        sum_ = inst.definition[3].operation.params[0]
+        self.assertEqual(sum_.parameters, {GAMMA, PHI})
+        self.assertEqual(sum_.bind({GAMMA: 1, PHI: 2}).numeric(), 3)
+
+    def test_parameter_map_global_phase(self):
+        """Verify that the parameter map is also applied to a parametric global phase."""
+        qc = QuantumCircuit(1, global_phase=THETA)
+        qc.rz(THETA, 0)
+
+        inst = circuit_to_instruction(qc, {THETA: GAMMA})
+
+        self.assertEqual(inst.params, [GAMMA])
+        self.assertEqual(inst.definition.global_phase, GAMMA)
+        self.assertEqual(inst.definition.parameters, {GAMMA})
+        # The input circuit should be untouched.
+        self.assertEqual(qc.global_phase, THETA)
+        self.assertEqual(qc.parameters, {THETA})
+
+    def test_parameter_map_blueprint_circuit(self):
+        """Verify that a parameter map is applied to a blueprint circuit that has not been built
+        yet, when it is converted directly rather than through ``to_instruction``."""
+        circuit = TwoLocal(2, "ry", "cx", reps=1)
+        new_params = ParameterVector("x", circuit.num_parameters_settable)
+        parameter_map = dict(zip(circuit.ordered_parameters, new_params))
+        self.assertFalse(circuit._is_built)
+
+        inst = circuit_to_instruction(circuit, parameter_map)
+
+        self.assertEqual(inst.params, list(new_params))
+        self.assertEqual(inst.definition.parameters, set(new_params))
 
     def test_zero_operands(self):
         """Test that an instruction can be created, even if it has zero operands."""
@@ -187,13 +238,14 @@ class TestCircuitToInstruction(QiskitTestCase):
         self.assertEqual(instruction.definition, base)
         compound = QuantumCircuit(1)
         compound.append(instruction, [], [])
+        self.assertEqual(compound.data[0].qubits, ())
+        self.assertEqual(compound.data[0].clbits, ())
         np.testing.assert_allclose(-np.eye(2), Operator(compound), atol=1e-16)
 
     def test_forbids_captured_vars(self):
         """Instructions (here an analogue of functions) cannot close over outer scopes."""
-        qc = QuantumCircuit(captures=[expr.Var.new("a", types.Bool())])
-        with self.assertRaisesRegex(QiskitError, "Circuits that capture variables cannot"):
-            qc.to_instruction()
+        with self.assertRaisesRegex(QiskitError, _CAPTURES_RE):
+            self.captured_vars_circuit.to_instruction()
 
     def test_forbids_input_vars(self):
         """This test can be relaxed when we have proper support for the behavior.
@@ -201,9 +253,8 @@ class TestCircuitToInstruction(QiskitTestCase):
         This actually has a natural meaning; the input variables could become typed parameters.
         We don't have a formal structure for managing that yet, though, so it's forbidden until the
         library is ready for that."""
-        qc = QuantumCircuit(inputs=[expr.Var.new("a", types.Bool())])
-        with self.assertRaisesRegex(QiskitError, "Circuits with 'input' variables cannot"):
-            qc.to_instruction()
+        with self.assertRaisesRegex(QiskitError, _INPUTS_RE):
+            self.input_vars_circuit.to_instruction()
 
     def test_forbids_declared_vars(self):
         """This test can be relaxed when we have proper support for the behavior.
@@ -213,13 +264,8 @@ class TestCircuitToInstruction(QiskitTestCase):
         starting off as forbidden is because we don't have a good way to support variable renaming
         during unrolling in transpilation, and we want the error to indicate an alternative at the
         point the conversion happens."""
-        qc = QuantumCircuit()
-        qc.add_var("a", False)
-        with self.assertRaisesRegex(
-            QiskitError,
-            "Circuits with internal variables.*You may be able to use `QuantumCircuit.compose`",
-        ):
-            qc.to_instruction()
+        with self.assertRaisesRegex(QiskitError, _DECLARED_RE):
+            self.declared_vars_circuit.to_instruction()
 
 
 if __name__ == "__main__":